@@ -4,6 +4,270 @@ import math
 from datetime import datetime
 import json
 import os
+import sys
+from dataclasses import dataclass
+
+import numpy as np
+from numba import njit, prange, set_num_threads
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# %0.99 gürültü oranı için tahmini SNR (≈ 20 dB), bir kez hesaplanır
+_SNR_DB_FOR_0_0099 = 10 * math.log10(1 / 0.0099)
+
+
+# fastmath kullanılmaz: gönderici (çekirdek) ve alıcı (Python hızlı yolu) aynı
+# girdilerde bit düzeyinde aynı frekansı üretmelidir
+@njit(cache=True)
+def _calc_freq_core(amplitude, time_ms, energy, f0, band_min, band_max, k1_arr, k2_constant, start_idx):
+    """
+    calculate_frequency için derlenmiş sayısal çekirdek
+    
+    Returns:
+        tuple: (frequency, k1, k2, k_index, attempts, is_valid)
+    """
+    n = k1_arr.size
+    for i in range(n):
+        k_index = (start_idx + i) % n
+        k1 = k1_arr[k_index]
+        
+        # Temel Formül: f = f₀ + (A × k₁ + E × k₂) / t
+        frequency = f0 + (amplitude * k1 + energy * k2_constant) / time_ms
+        
+        # S Bandı kontrolü ve düzeltme
+        if frequency < band_min:
+            frequency = float(band_min)
+        elif frequency > band_max:
+            frequency = float(band_max)
+        
+        if band_min <= frequency <= band_max:
+            return frequency, k1, k2_constant, k_index, i + 1, True
+    
+    # Eğer hiçbiri bir işe yaramazsa (çok nadir bir durum)
+    return float(f0), 10, 100, start_idx, n, False
+
+
+@njit(parallel=True, cache=True)
+def _sender_batch(amplitude, time_ms, energy, f0, band_min, band_max, k1_arr, k2_constant, start_idx,
+                  out_freq, out_k1, out_k_index, out_attempts, out_valid):
+    """
+    Birbirinden bağımsız hop'ların frekanslarını paralel olarak hesaplar
+    
+    i. hop, (start_idx + i) indeksli k1×k2 değeriyle başlar; sonuçlar out_* dizilerine yazılır.
+    """
+    n = k1_arr.size
+    for i in prange(amplitude.size):
+        frequency, k1, k2, k_index, attempts, is_valid = _calc_freq_core(
+            amplitude[i], time_ms[i], energy[i], f0, band_min, band_max,
+            k1_arr, k2_constant, (start_idx + i) % n
+        )
+        out_freq[i] = frequency
+        out_k1[i] = k1
+        out_k_index[i] = k_index
+        out_attempts[i] = attempts
+        out_valid[i] = is_valid
+
+
+def _warmup():
+    """
+    Numba çekirdeklerini küçük örnek girdilerle bir kez çalıştırır
+    
+    İlk çağrıda derleme (veya __pycache__ önbelleğinden yükleme) burada yapılır,
+    böylece simülasyon sırasında derleme süresi ödenmez.
+    """
+    k1_arr = np.array([10, 20], dtype=np.int64)
+    values = np.full(2, 2.0)
+    
+    _calc_freq_core(3.0, 2.0, 18.0, 2000, 2000, 4000, k1_arr, 100, 0)
+    _sender_batch(values, values, values, 2000, 2000, 4000, k1_arr, 100, 0,
+                  np.empty(2), np.empty(2, dtype=np.int64), np.empty(2, dtype=np.int64),
+                  np.empty(2, dtype=np.int64), np.empty(2, dtype=np.bool_))
+
+
+@dataclass(slots=True)
+class HopResult:
+    """
+    Tek bir hop için frekans hesaplama sonucu
+    """
+    frequency: float
+    amplitude: float
+    time_ms: float
+    energy: float
+    k1: int
+    k2: int
+    k_index: int
+    is_valid: bool
+    attempts: int
+
+
+@dataclass
+class HopArrays:
+    """
+    Hop sonuçlarını paralel NumPy dizilerinde tutar (her alan bir sütun)
+    
+    Sözlük listesi yalnızca dışa aktarma sırasında as_dicts() ile üretilir.
+    Zaman damgası hop başına değil, simülasyon başına bir kez alınır.
+    Alıcıya özgü sütunlar gönderici sonuçlarında None olarak kalır.
+    """
+    operation: str
+    f0: int
+    k2: int
+    freq: np.ndarray
+    amp: np.ndarray
+    time_ms: np.ndarray
+    energy: np.ndarray
+    k1: np.ndarray
+    k_index: np.ndarray
+    is_valid: np.ndarray
+    attempts: np.ndarray
+    start_hop_counter: int = 0
+    started_at: str = None
+    sent_freq: np.ndarray = None
+    freq_diff: np.ndarray = None
+    is_match: np.ndarray = None
+    is_valid_amp: np.ndarray = None
+    is_valid_time: np.ndarray = None
+    calc_valid: np.ndarray = None
+    
+    @classmethod
+    def empty(cls, hop_count, operation, f0, k2, start_hop_counter=0):
+        """
+        Belirtilen hop sayısı için boş sütunlar ayırır
+        
+        Args:
+            hop_count (int): Hop sayısı
+            operation (str): 'sender' veya 'receiver'
+            f0 (int): Başlangıç frekansı
+            k2 (int): k2 sabit değeri
+            start_hop_counter (int): İlk hop'taki hop sayacı
+        
+        Returns:
+            HopArrays: Doldurulmaya hazır sonuç dizileri
+        """
+        return cls(
+            operation=operation,
+            f0=f0,
+            k2=k2,
+            freq=np.zeros(hop_count, dtype=np.float64),
+            amp=np.empty(hop_count, dtype=np.float64),
+            time_ms=np.empty(hop_count, dtype=np.float64),
+            energy=np.empty(hop_count, dtype=np.float64),
+            k1=np.zeros(hop_count, dtype=np.int64),
+            k_index=np.zeros(hop_count, dtype=np.int64),
+            is_valid=np.zeros(hop_count, dtype=np.bool_),
+            attempts=np.zeros(hop_count, dtype=np.int64),
+            start_hop_counter=start_hop_counter,
+            started_at=datetime.now().isoformat()
+        )
+    
+    def __len__(self):
+        return self.freq.size
+    
+    def as_dicts(self, algorithm, include_formulas=True, sender_rows=None):
+        """
+        Sonuçları hop başına sözlük listesine dönüştürür (JSON dışa aktarma için)
+        
+        Satır düzeni, sonuçların doğrudan sözlük olarak üretildiği önceki sürümle aynıdır.
+        
+        Args:
+            algorithm (SecureFHSSAlgorithm): Senkronizasyon ve doğrulama ayrıntıları için
+            include_formulas (bool): Formül ve hesaplama metinleri eklensin mi
+            sender_rows (list): Alıcı satırlarındaki 'original_data' için gönderici satırları
+        
+        Returns:
+            list: Hop sonuçları
+        """
+        is_receiver = self.freq_diff is not None
+        
+        rows = []
+        for i in range(len(self)):
+            a = float(self.amp[i])
+            # Gönderici zamanı sabittir (t_hop); alıcı zamanı ölçülen değerdir
+            t = float(self.time_ms[i]) if is_receiver else algorithm.t_hop
+            e = float(self.energy[i])
+            sync_info = algorithm._sync_info(self.start_hop_counter + i)
+            
+            if is_receiver:
+                if self.is_valid[i]:
+                    freq_result = {
+                        'frequency': float(self.freq[i]),
+                        'amplitude': a,
+                        'time_ms': t,
+                        'energy': e,
+                        **self._frequency_fields(i, a, t, e, include_formulas)
+                    }
+                else:
+                    freq_result = {'frequency': 0, 'is_valid': False}
+                
+                # Reddedilen hop'ta fark sonsuzdur; orjson ve json aynı çıktıyı versin diye null yazılır
+                freq_diff = float(self.freq_diff[i])
+                
+                row = {
+                    'hop_number': i + 1,
+                    'timestamp': self.started_at,
+                    'operation': self.operation,
+                    'original_data': sender_rows[i] if sender_rows is not None else None,
+                    'amplitude': a,
+                    'time_ms': t,
+                    'energy': e,
+                    'generation_method': 'receiver_measured',
+                    'validation': algorithm.validation_details(a, t),
+                    'freq_result': freq_result,
+                    'frequency_difference': freq_diff if math.isfinite(freq_diff) else None,
+                    'is_match': bool(self.is_match[i]),
+                    'sync_info': sync_info
+                }
+            else:
+                row = {
+                    'hop_number': i + 1,
+                    'timestamp': self.started_at,
+                    'operation': self.operation,
+                    'amplitude': a,
+                    'time_ms': t,
+                    'energy': e,
+                    'generation_method': 'sender_generated',
+                    'frequency': float(self.freq[i]),
+                    **self._frequency_fields(i, a, t, e, include_formulas),
+                    'sync_info': sync_info
+                }
+            
+            rows.append(row)
+        
+        return rows
+    
+    def _frequency_fields(self, i, a, t, e, include_formulas):
+        """
+        i. hop için calculate_frequency sonucundaki k1/k2 ve formül alanlarını üretir
+        """
+        f0 = self.f0
+        k2 = self.k2
+        k1 = int(self.k1[i])
+        # Alıcıda is_valid sinyal doğrulamasıdır; frekans hesabının geçerliliği calc_valid'dedir
+        is_valid = bool(self.is_valid[i] if self.calc_valid is None else self.calc_valid[i])
+        
+        if not include_formulas:
+            formula = calculation = None
+        elif is_valid:
+            formula = f"f = {f0} + ({a:.2f} × {k1} + {e:.2f} × {k2}) / {t}"
+            calculation = f"f = {f0} + ({a * k1:.1f} + {e * k2:.1f}) / {t}"
+        else:
+            formula = f"FALLBACK: f = {f0} (bant dışı)"
+            calculation = f"FALLBACK: f = {f0}"
+        
+        return {
+            'k1': k1,
+            'k2': k2,
+            'k1_k2_product': k1 * k2,
+            'k_index': int(self.k_index[i]),
+            'formula': formula,
+            'calculation': calculation,
+            'is_valid': is_valid,
+            'attempts': int(self.attempts[i])
+        }
+
 
 class SecureFHSSAlgorithm:
     """
@@ -39,17 +303,28 @@ class SecureFHSSAlgorithm:
         self.amplitude_tolerance = 0.3  # V - Genlik toleransı (sabit)
         self.time_tolerance = 0.1  # ms - Zaman toleransı
         
+        # Doğrulama sınırları (her hop'ta yeniden hesaplanmaz)
+        self._amp_lo = self.nominal_amplitude - self.amplitude_tolerance
+        self._amp_hi = self.nominal_amplitude + self.amplitude_tolerance
+        self._t_lo = self.t_hop - self.time_tolerance
+        self._t_hi = self.t_hop + self.time_tolerance
+        
         # Dinamik k1 * k2 listesi (1000-3000 aralığında 5 rastgele değer)
-        random.seed(self.sync_key)
-        self.k1_k2_list = sorted([random.randint(1000, 3000) for _ in range(5)])
+        key_random = random.Random(self.sync_key)
+        self.k1_k2_list = sorted([key_random.randint(1000, 3000) for _ in range(5)])
         self.k2_constant = 100  # k2 sabit değer
+        # k1 değerleri her indeks için sabittir: k1 = (k1×k2) // k2
+        self.k1_arr = np.array([p // self.k2_constant for p in self.k1_k2_list], dtype=np.int64)
         
         # Algoritma durumu
         self.current_k_index = 0
         self.hop_counter = 0
         
-        # Senkronizasyon için seed sıfırla
-        random.seed(self.sync_key)
+        # Konsol çıktısını görsel olarak yavaşlatmak için (algoritmayı etkilemez)
+        self.visual_pacing = False
+        
+        # Hop başına rastgele değerler için senkronize üreteç
+        self.rng = np.random.default_rng(self.sync_key)
         
         print("FREKANS ATLAMALI VE FİZİKSEL KATMANLI GÜVENLİ HABERLEŞME ALGORİTMASI")
         print(f"Senkronizasyon anahtarı: {sync_key}")
@@ -61,18 +336,6 @@ class SecureFHSSAlgorithm:
         print(f"Dinamik k1×k2 listesi: {self.k1_k2_list}")
         print("-" * 70)
     
-    def get_k1_k2_values(self):
-        """
-        Şifreli katsayı listesinden k1 ve k2 değerlerini döndürür
-        
-        Returns:
-            tuple: (k1, k2) değerleri
-        """
-        k1_k2_product = self.k1_k2_list[self.current_k_index % len(self.k1_k2_list)]
-        k1 = k1_k2_product // self.k2_constant
-        k2 = self.k2_constant
-        return k1, k2
-    
     def calculate_frequency(self, amplitude, time_ms, energy):
         """
         Temel algoritma: Frekans hesaplama formülü
@@ -85,69 +348,44 @@ class SecureFHSSAlgorithm:
             energy (float): Enerji (E) - A² × t
         
         Returns:
-            dict: Hesaplama sonuçları
+            HopResult: Hesaplama sonuçları
         """
+        f0 = self.f0
+        band_min = self.band_min
+        band_max = self.band_max
+        current_k_index = self.current_k_index
+        
         # Sıfır bölme koruması
         if time_ms <= 0:
             time_ms = self.t_hop
         
-        attempts = 0
-        max_attempts = len(self.k1_k2_list)
-        original_k_index = self.current_k_index
+        # Hızlı yol: ilk k1×k2 değeriyle hesapla, bant içindeyse deneme döngüsüne girme
+        k1_arr = self.k1_arr
+        k1 = int(k1_arr[current_k_index % k1_arr.size])
+        k2 = self.k2_constant
+        frequency = f0 + (amplitude * k1 + energy * k2) / time_ms
         
-        while attempts < max_attempts:
-            # Şifreli listeden k1, k2 değerlerini al
-            k1, k2 = self.get_k1_k2_values()
-            
-            # Temel Formül: f = f₀ + (A × k₁ + E × k₂) / t
-            try:
-                frequency = self.f0 + (amplitude * k1 + energy * k2) / time_ms
-            except ZeroDivisionError:
-                frequency = self.f0
-            
-            # S Bandı kontrolü ve düzeltme
-            if frequency < self.band_min:
-                frequency = self.band_min
-            elif frequency > self.band_max:
-                frequency = self.band_max
-                
-            if self.band_min <= frequency <= self.band_max:
-                result = {
-                    'frequency': frequency,
-                    'amplitude': amplitude,
-                    'time_ms': time_ms,
-                    'energy': energy,
-                    'k1': k1,
-                    'k2': k2,
-                    'k1_k2_product': k1 * k2,
-                    'k_index': self.current_k_index,
-                    'formula': f"f = {self.f0} + ({amplitude:.2f} × {k1} + {energy:.2f} × {k2}) / {time_ms}",
-                    'calculation': f"f = {self.f0} + ({amplitude * k1:.1f} + {energy * k2:.1f}) / {time_ms}",
-                    'is_valid': True,
-                    'attempts': attempts + 1
-                }
-                return result
-            
-            # Eğer bant dışındaysa, listedeki bir sonraki k1×k2 değerini dene
-            self.current_k_index = (self.current_k_index + 1) % len(self.k1_k2_list)
-            attempts += 1
+        # S Bandı kontrolü ve düzeltme (NaN değerler bant dışı kalır)
+        frequency = min(max(frequency, band_min), band_max)
         
-        # Eğer hiçbiri bir işe yaramazsa (çok nadir bir durum)
-        self.current_k_index = original_k_index
-        return {
-            'frequency': self.f0,
-            'amplitude': amplitude,
-            'time_ms': time_ms,
-            'energy': energy,
-            'k1': 10,
-            'k2': 100,
-            'k1_k2_product': 1000,
-            'k_index': self.current_k_index,
-            'formula': f"FALLBACK: f = {self.f0} (bant dışı)",
-            'calculation': f"FALLBACK: f = {self.f0}",
-            'is_valid': False,
-            'attempts': max_attempts
-        }
+        if band_min <= frequency <= band_max:
+            return HopResult(frequency, amplitude, time_ms, energy, k1, k2,
+                             current_k_index, True, 1)
+        
+        # Nadir durum: listedeki diğer k1×k2 değerlerini dene
+        frequency, k1, k2, k_index, attempts, is_valid = _calc_freq_core(
+            amplitude, time_ms, energy, f0, band_min, band_max,
+            k1_arr, k2, current_k_index
+        )
+        
+        if is_valid:
+            # Bant dışı denemelerde listedeki bir sonraki k1×k2 değerine geçilmiş olabilir
+            self.current_k_index = int(k_index)
+            return HopResult(frequency, amplitude, time_ms, energy, int(k1), int(k2),
+                             self.current_k_index, True, int(attempts))
+        
+        return HopResult(frequency, amplitude, time_ms, energy, 10, 100,
+                         current_k_index, False, int(attempts))
     
     def generate_signal_parameters(self):
         """
@@ -157,7 +395,7 @@ class SecureFHSSAlgorithm:
             dict: Üretilen sinyal değerleri
         """
         # Genlik üretimi: 3V ± 0.15V aralığında (daha dar)
-        amplitude = self.nominal_amplitude + random.uniform(-0.15, 0.15)
+        amplitude = self.nominal_amplitude + self.rng.uniform(-0.15, 0.15)
         
         # Zaman sabit: 2 ms
         time_ms = self.t_hop
@@ -200,17 +438,25 @@ class SecureFHSSAlgorithm:
             time_ms (float): Kontrol edilecek zaman
         
         Returns:
-            dict: Doğrulama sonucu
+            tuple: (is_valid, is_valid_amplitude, is_valid_time)
         """
-        min_amplitude = self.nominal_amplitude - self.amplitude_tolerance
-        max_amplitude = self.nominal_amplitude + self.amplitude_tolerance
-        min_time = self.t_hop - self.time_tolerance
-        max_time = self.t_hop + self.time_tolerance
+        is_valid_amplitude = self._amp_lo <= amplitude <= self._amp_hi
+        is_valid_time = self._t_lo <= time_ms <= self._t_hi
         
-        is_valid_amplitude = min_amplitude <= amplitude <= max_amplitude
-        is_valid_time = min_time <= time_ms <= max_time
+        return is_valid_amplitude and is_valid_time, is_valid_amplitude, is_valid_time
+    
+    def validation_details(self, amplitude, time_ms):
+        """
+        Doğrulama sonucunu ayrıntılı olarak döndürür (kayıt/dışa aktarma için)
         
-        is_valid = is_valid_amplitude and is_valid_time
+        Args:
+            amplitude (float): Kontrol edilecek genlik
+            time_ms (float): Kontrol edilecek zaman
+        
+        Returns:
+            dict: Doğrulama sonucu
+        """
+        is_valid, is_valid_amplitude, is_valid_time = self.validate_signal(amplitude, time_ms)
         
         return {
             'is_valid': is_valid,
@@ -218,10 +464,10 @@ class SecureFHSSAlgorithm:
             'is_valid_time': is_valid_time,
             'amplitude': amplitude,
             'time_ms': time_ms,
-            'min_allowed_amplitude': min_amplitude,
-            'max_allowed_amplitude': max_amplitude,
-            'min_allowed_time': min_time,
-            'max_allowed_time': max_time,
+            'min_allowed_amplitude': self._amp_lo,
+            'max_allowed_amplitude': self._amp_hi,
+            'min_allowed_time': self._t_lo,
+            'max_allowed_time': self._t_hi,
             'tolerance_amplitude': self.amplitude_tolerance,
             'tolerance_time': self.time_tolerance
         }
@@ -233,26 +479,54 @@ class SecureFHSSAlgorithm:
         Returns:
             dict: Senkronizasyon durumu
         """
-        if self.hop_counter % 100 == 0 and self.hop_counter > 0:
+        return self._sync_info(self.hop_counter)
+    
+    def _sync_info(self, hop_count):
+        """
+        Verilen hop sayacı için senkronizasyon durumunu döndürür
+        
+        Args:
+            hop_count (int): Hop sayacı
+        
+        Returns:
+            dict: Senkronizasyon durumu
+        """
+        if hop_count % 100 == 0 and hop_count > 0:
             return {
                 'sync_needed': True,
-                'hop_count': self.hop_counter,
+                'hop_count': hop_count,
                 'reference_freq': 2750,  # MHz
                 'test_amplitude': self.nominal_amplitude,
                 'test_duration': 5,  # ms
-                'message': f"Senkronizasyon kontrolü #{self.hop_counter // 100}"
+                'message': f"Senkronizasyon kontrolü #{hop_count // 100}"
             }
         return {
             'sync_needed': False,
-            'hop_count': self.hop_counter
+            'hop_count': hop_count
         }
     
+    def _advance_hop(self, hop_count=1):
+        """
+        Algoritma durumunu verilen hop sayısı kadar ilerletir (sonuç döndürmez)
+        
+        Args:
+            hop_count (int): İlerletilecek hop sayısı
+        """
+        n = len(self.k1_k2_list)
+        hop_counter = self.hop_counter + hop_count
+        k_index = (self.current_k_index + hop_count) % n
+        
+        self.hop_counter = hop_counter
+        self.current_k_index = k_index
+    
     def next_hop(self):
         """
         Bir sonraki hop için algoritma durumunu günceller
+        
+        Returns:
+            dict: Yeni hop durumu
         """
-        self.hop_counter += 1
-        self.current_k_index = (self.current_k_index + 1) % len(self.k1_k2_list)
+        self._advance_hop()
         
         return {
             'hop_counter': self.hop_counter,
@@ -268,55 +542,62 @@ class SecureFHSSAlgorithm:
             hop_count (int): Simüle edilecek hop sayısı
         
         Returns:
-            list: Gönderici işlem sonuçları
+            HopArrays: Gönderici işlem sonuçları
         """
-        results = []
+        results = HopArrays.empty(hop_count, 'sender', self.f0, self.k2_constant, self.hop_counter)
+        lines = []
         
         print(f"Gönderici simülasyonu - {hop_count} hop")
         print("-" * 50)
         
-        for i in range(hop_count):
-            # Sinyal değerlerini üret
-            params = self.generate_signal_parameters()
-            
-            # Frekansı hesapla
-            freq_result = self.calculate_frequency(
-                params['amplitude'], 
-                params['time_ms'], 
-                params['energy']
-            )
-            
-            # Senkronizasyon kontrolü
-            sync_result = self.sync_check()
-            
-            # Sonuçları birleştir
-            result = {
-                'hop_number': i + 1,
-                'timestamp': datetime.now().isoformat(),
-                'operation': 'sender',
-                **params,
-                **freq_result,
-                'sync_info': sync_result
-            }
-            
-            results.append(result)
-            
-            # Konsol çıktısı
-            status = "GECERLI" if freq_result['is_valid'] else "GECERSIZ"
-            print(f"Hop #{i+1:02d} {status} | "
-                  f"A:{params['amplitude']:.2f}V | "
-                  f"E:{params['energy']:.1f} | "
-                  f"f:{freq_result['frequency']:.1f}MHz | "
-                  f"k1×k2:{freq_result['k1_k2_product']}")
-            
-            if sync_result['sync_needed']:
-                print(f"        {sync_result['message']}")
+        # Tüm hop'lar için genlikleri tek seferde üret: 3V ± 0.15V
+        results.amp[:] = self.nominal_amplitude + self.rng.uniform(-0.15, 0.15, hop_count)
+        
+        # Zaman sabit: 2 ms
+        results.time_ms[:] = self.t_hop
+        
+        # Enerji hesaplama: E = A² × t
+        results.energy[:] = results.amp ** 2 * self.t_hop
+        
+        # Frekansları hesapla: her hop'un k1×k2 indeksi _advance_hop() ile aynı sırada ilerler
+        _sender_batch(
+            results.amp, results.time_ms, results.energy, self.f0, self.band_min, self.band_max,
+            self.k1_arr, self.k2_constant, self.current_k_index,
+            results.freq, results.k1, results.k_index, results.attempts, results.is_valid
+        )
+        k2 = self.k2_constant
+        start_hop_counter = self.hop_counter
+        visual_pacing = self.visual_pacing
+        append_line = lines.append
+        
+        for i, (a, e, f, k, ok) in enumerate(zip(results.amp.tolist(), results.energy.tolist(),
+                                                 results.freq.tolist(), results.k1.tolist(),
+                                                 results.is_valid.tolist())):
+            # Konsol çıktısı (visual_pacing kapalıyken döngü sonunda tek seferde yazılır)
+            status = "GECERLI" if ok else "GECERSIZ"
+            append_line(f"Hop #{i+1:02d} {status} | "
+                        f"A:{a:.2f}V | "
+                        f"E:{e:.1f} | "
+                        f"f:{f:.1f}MHz | "
+                        f"k1×k2:{k * k2}")
             
-            # Bir sonraki hop'a geç
-            self.next_hop()
+            # Senkronizasyon kontrolü (her 100 hop'ta bir)
+            hop_counter = start_hop_counter + i
+            if hop_counter and hop_counter % 100 == 0:
+                append_line(f"        Senkronizasyon kontrolü #{hop_counter // 100}")
             
-            # Kısa bekleme (simülasyon için)
-            time.sleep(0.001)
+            # Görsel simülasyonda satırlar hop hop yazılır, ardından kısa bekleme yapılır
+            if visual_pacing:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+                lines.clear()
+                time.sleep(0.001)
+        
+        # Algoritma durumunu tüm hop'lar için tek seferde ilerlet
+        self._advance_hop(hop_count)
+        
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
         
         return results
     
@@ -325,15 +606,16 @@ class SecureFHSSAlgorithm:
         Alıcı simülasyonu: Teorik alıcı işlemi
         
         Args:
-            sender_results (list): Gönderici sonuçları
+            sender_results (HopArrays): Gönderici sonuçları
             noise_level (float): Gürültü seviyesi (0.0099 = %0.99, SNR ≈ 20 dB)
         
         Returns:
-            list: Alıcı işlem sonuçları
+            HopArrays: Alıcı işlem sonuçları
         """
-        results = []
+        hop_total = len(sender_results)
+        lines = []
         
-        print(f"\nAlıcı simülasyonu - {len(sender_results)} hop")
+        print(f"\nAlıcı simülasyonu - {hop_total} hop")
         print(f"Gürültü seviyesi: %{noise_level*100:.2f} (SNR ≈ 20 dB)")
         print("-" * 50)
         
@@ -341,79 +623,90 @@ class SecureFHSSAlgorithm:
         self.current_k_index = 0
         self.hop_counter = 0
         
-        for i, sender_data in enumerate(sender_results):
-            # Gürültülü sinyal simülasyonu
-            noise_factor = 1 + random.uniform(-noise_level, noise_level)
-            
-            received_amplitude = sender_data['amplitude'] * noise_factor
-            received_energy = sender_data['energy'] * noise_factor
-            received_time = sender_data['time_ms'] + random.uniform(-0.05, 0.05)
-            
-            # Sinyal değerlerini ölç
-            measured_params = self.measure_signal_parameters(
-                received_amplitude, received_energy, received_time
-            )
-            
-            # Sinyal doğruluğunu kontrol et
-            validation = self.validate_signal(measured_params['amplitude'], measured_params['time_ms'])
+        results = HopArrays.empty(hop_total, 'receiver', self.f0, self.k2_constant)
+        results.sent_freq = sender_results.freq.copy()
+        results.freq_diff = np.full(hop_total, np.inf)
+        results.is_match = np.zeros(hop_total, dtype=np.bool_)
+        results.is_valid_amp = np.zeros(hop_total, dtype=np.bool_)
+        results.is_valid_time = np.zeros(hop_total, dtype=np.bool_)
+        results.calc_valid = np.zeros(hop_total, dtype=np.bool_)
+        
+        # Gürültülü sinyal simülasyonu: tüm hop'lar için tek seferde
+        noise_factors = 1 + self.rng.uniform(-noise_level, noise_level, hop_total)
+        time_jitters = self.rng.uniform(-0.05, 0.05, hop_total)
+        
+        results.amp[:] = sender_results.amp * noise_factors
+        results.energy[:] = sender_results.energy * noise_factors
+        results.time_ms[:] = sender_results.time_ms + time_jitters
+        
+        # Sinyal doğruluğunu kontrol et
+        results.is_valid_amp[:] = (results.amp >= self._amp_lo) & (results.amp <= self._amp_hi)
+        results.is_valid_time[:] = (results.time_ms >= self._t_lo) & (results.time_ms <= self._t_hi)
+        results.is_valid[:] = results.is_valid_amp & results.is_valid_time
+        results.k_index[:] = np.arange(hop_total) % self.k1_arr.size
+        
+        # AYNI ALGORİTMAYI kullanarak yalnızca geçerli sinyallerin frekansını hesapla
+        calculate_frequency = self.calculate_frequency
+        amp, time_ms, energy = results.amp, results.time_ms, results.energy
+        freq, k1, k_index, attempts = results.freq, results.k1, results.k_index, results.attempts
+        calc_valid = results.calc_valid
+        
+        for i in np.flatnonzero(results.is_valid).tolist():
+            self.current_k_index = int(k_index[i])
+            freq_result = calculate_frequency(float(amp[i]), float(time_ms[i]), float(energy[i]))
             
-            if validation['is_valid']:
-                # AYNI ALGORİTMAYI kullanarak frekansı hesapla
-                freq_result = self.calculate_frequency(
-                    measured_params['amplitude'],
-                    measured_params['time_ms'],
-                    measured_params['energy']
-                )
-                
-                # Orijinal frekansla karşılaştır
-                freq_difference = abs(freq_result['frequency'] - sender_data['frequency'])
-                is_match = freq_difference < 40.0  # 40 MHz tolerans
-                status = "KABUL" if is_match else "REDDEDILDI"
-                
-                print(f"Hop #{i+1:02d} {status} | "
-                      f"A:{measured_params['amplitude']:.2f}V | "
-                      f"t:{measured_params['time_ms']:.2f}ms | "
-                      f"f:{freq_result['frequency']:.1f}MHz | "
-                      f"Δf:{freq_difference:.1f}MHz")
-                
+            freq[i] = freq_result.frequency
+            k1[i] = freq_result.k1
+            k_index[i] = freq_result.k_index
+            attempts[i] = freq_result.attempts
+            calc_valid[i] = freq_result.is_valid
+        
+        self.current_k_index = 0
+        
+        # Orijinal frekansla karşılaştır (40 MHz tolerans)
+        valid = results.is_valid
+        results.freq_diff[valid] = np.abs(results.freq[valid] - results.sent_freq[valid])
+        results.is_match[:] = results.freq_diff < 40.0
+        
+        start_hop_counter = self.hop_counter
+        visual_pacing = self.visual_pacing
+        append_line = lines.append
+        
+        for i, (a, t, f, df, ok, ok_amp, match) in enumerate(zip(
+                amp.tolist(), time_ms.tolist(), freq.tolist(),
+                results.freq_diff.tolist(), valid.tolist(), results.is_valid_amp.tolist(),
+                results.is_match.tolist())):
+            if ok:
+                status = "KABUL" if match else "REDDEDILDI"
+                append_line(f"Hop #{i+1:02d} {status} | "
+                            f"A:{a:.2f}V | "
+                            f"t:{t:.2f}ms | "
+                            f"f:{f:.1f}MHz | "
+                            f"Δf:{df:.1f}MHz")
             else:
-                freq_result = {'frequency': 0, 'is_valid': False}
-                freq_difference = float('inf')
-                is_match = False
-                
-                reason = "Genlik tolerans dışı" if not validation['is_valid_amplitude'] else "Zaman tolerans dışı"
-                print(f"Hop #{i+1:02d} REDDEDILDI | "
-                      f"A:{measured_params['amplitude']:.2f}V | "
-                      f"t:{measured_params['time_ms']:.2f}ms | "
-                      f"SİNYAL REDDEDİLDİ ({reason})")
-            
-            # Senkronizasyon kontrolü
-            sync_result = self.sync_check()
-            
-            # Sonuçları birleştir
-            result = {
-                'hop_number': i + 1,
-                'timestamp': datetime.now().isoformat(),
-                'operation': 'receiver',
-                'original_data': sender_data,
-                **measured_params,
-                'validation': validation,
-                'freq_result': freq_result,
-                'frequency_difference': freq_difference,
-                'is_match': is_match,
-                'sync_info': sync_result
-            }
-            
-            results.append(result)
-            
-            if sync_result['sync_needed']:
-                print(f"        {sync_result['message']}")
+                reason = "Genlik tolerans dışı" if not ok_amp else "Zaman tolerans dışı"
+                append_line(f"Hop #{i+1:02d} REDDEDILDI | "
+                            f"A:{a:.2f}V | "
+                            f"t:{t:.2f}ms | "
+                            f"SİNYAL REDDEDİLDİ ({reason})")
             
-            # Bir sonraki hop'a geç
-            self.next_hop()
+            # Senkronizasyon kontrolü (her 100 hop'ta bir)
+            hop_counter = start_hop_counter + i
+            if hop_counter and hop_counter % 100 == 0:
+                append_line(f"        Senkronizasyon kontrolü #{hop_counter // 100}")
             
-            # Kısa bekleme (simülasyon için)
-            time.sleep(0.001)
+            # Görsel simülasyonda satırlar hop hop yazılır, ardından kısa bekleme yapılır
+            if visual_pacing:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+                lines.clear()
+                time.sleep(0.001)
+        
+        # Algoritma durumunu tüm hop'lar için tek seferde ilerlet
+        self._advance_hop(hop_total)
+        
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
         
         return results
     
@@ -422,37 +715,48 @@ class SecureFHSSAlgorithm:
         İstatistik hesaplama
         
         Args:
-            sender_results (list): Gönderici sonuçları
-            receiver_results (list): Alıcı sonuçları
+            sender_results (HopArrays): Gönderici sonuçları
+            receiver_results (HopArrays): Alıcı sonuçları
         
         Returns:
             dict: İstatistikler
         """
         # Gönderici istatistikleri
-        sender_frequencies = [r['frequency'] for r in sender_results if r.get('is_valid', False)]
+        sender_frequencies = sender_results.freq[sender_results.is_valid]
+        valid_hops = int(sender_frequencies.size)
+        
+        # Ortalama, min ve max geçerli frekanslar üzerinden birer kez hesaplanır
+        if valid_hops:
+            avg_frequency = float(sender_frequencies.sum()) / valid_hops
+            min_frequency = float(sender_frequencies.min())
+            max_frequency = float(sender_frequencies.max())
+        else:
+            avg_frequency = min_frequency = max_frequency = 0
+        
         sender_stats = {
             'total_hops': len(sender_results),
-            'valid_hops': len(sender_frequencies),
-            'avg_frequency': sum(sender_frequencies) / len(sender_frequencies) if sender_frequencies else 0,
-            'min_frequency': min(sender_frequencies) if sender_frequencies else 0,
-            'max_frequency': max(sender_frequencies) if sender_frequencies else 0,
-            'frequency_range': max(sender_frequencies) - min(sender_frequencies) if sender_frequencies else 0
+            'valid_hops': valid_hops,
+            'avg_frequency': avg_frequency,
+            'min_frequency': min_frequency,
+            'max_frequency': max_frequency,
+            'frequency_range': max_frequency - min_frequency
         }
         
         # Alıcı istatistikleri
-        valid_receptions = [r for r in receiver_results if r.get('validation', {}).get('is_valid', False)]
-        successful_matches = [r for r in valid_receptions if r.get('is_match', False)]
+        total_receptions = len(receiver_results)
+        valid_receptions = int(receiver_results.is_valid.sum())
+        successful_matches = int(receiver_results.is_match.sum())  # eşleşme yalnızca geçerli alımlarda olur
         
         # Gürültü oranı ve SNR tahmini
         noise_percentage = 0.99  # %0.99 (SNR ≈ 20 dB)
-        estimated_snr = 10 * math.log10(1 / (noise_percentage / 100))
+        estimated_snr = _SNR_DB_FOR_0_0099
         
         receiver_stats = {
-            'total_receptions': len(receiver_results),
-            'valid_receptions': len(valid_receptions),
-            'successful_matches': len(successful_matches),
-            'success_rate': (len(successful_matches) / len(receiver_results) * 100) if receiver_results else 0,
-            'validation_rate': (len(valid_receptions) / len(receiver_results) * 100) if receiver_results else 0,
+            'total_receptions': total_receptions,
+            'valid_receptions': valid_receptions,
+            'successful_matches': successful_matches,
+            'success_rate': (successful_matches / total_receptions * 100) if total_receptions else 0,
+            'validation_rate': (valid_receptions / total_receptions * 100) if total_receptions else 0,
             'noise_percentage': noise_percentage,
             'estimated_snr_db': estimated_snr
         }
@@ -462,14 +766,15 @@ class SecureFHSSAlgorithm:
             'receiver': receiver_stats
         }
     
-    def export_results(self, sender_results, receiver_results, filename=None):
+    def export_results(self, sender_results, receiver_results, filename=None, include_formulas=True):
         """
         Sonuçları JSON dosyasına kaydet
         
         Args:
-            sender_results (list): Gönderici sonuçları
-            receiver_results (list): Alıcı sonuçları
+            sender_results (HopArrays): Gönderici sonuçları
+            receiver_results (HopArrays): Alıcı sonuçları
             filename (str): Dosya adı
+            include_formulas (bool): Hop başına formül metinleri eklensin mi
         
         Returns:
             str: Kaydedilen dosya adı
@@ -478,6 +783,10 @@ class SecureFHSSAlgorithm:
             filename = f"fhss_simulation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
+            # Sözlükler yalnızca dışa aktarma sırasında üretilir
+            sender_rows = sender_results.as_dicts(self, include_formulas)
+            receiver_rows = receiver_results.as_dicts(self, include_formulas, sender_rows)
+            
             data = {
                 'algorithm_info': {
                     'name': 'Frekans Atlamalı ve Fiziksel Katmanlı Güvenli Haberleşme Sistemi',
@@ -491,17 +800,21 @@ class SecureFHSSAlgorithm:
                         'time_tolerance': self.time_tolerance,
                         'k1_k2_list': self.k1_k2_list,
                         'noise_level': 0.0099,  # %0.99 (SNR ≈ 20 dB)
-                        'estimated_snr_db': 10 * math.log10(1 / 0.0099),
+                        'estimated_snr_db': _SNR_DB_FOR_0_0099,
                         'freq_tolerance': 40.0  # MHz
                     }
                 },
-                'sender_results': sender_results,
-                'receiver_results': receiver_results,
+                'sender_results': sender_rows,
+                'receiver_results': receiver_rows,
                 'statistics': self.calculate_statistics(sender_results, receiver_results)
             }
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             
             print(f"Sonuçlar kaydedildi: {filename}")
             return filename
@@ -512,14 +825,27 @@ class SecureFHSSAlgorithm:
 
 
 # Örnek çalışma
-def main():
-    """Ana fonksiyon"""
+def main(num_threads=None):
+    """
+    Ana fonksiyon
+    
+    Args:
+        num_threads (int): Paralel hop hesaplamasında kullanılacak iş parçacığı sayısı.
+            numba.set_num_threads ile yalnızca çağıran iş parçacığı için ayarlanır ve
+            NUMBA_NUM_THREADS değerinden büyük olamaz (aksi halde hata mesajı yazdırılır).
+    """
     try:
         print("TEKNOFEST 2025 - GÜVENLİ UYDU HABERLEŞME SİSTEMİ")
         print("=" * 70)
         print("Teorik Proje - Algoritma Simülasyonu")
         print("=" * 70)
         
+        if num_threads is not None:
+            set_num_threads(num_threads)
+        
+        # Derlenmiş çekirdekleri hazırla
+        _warmup()
+        
         # Algoritma oluştur
         algorithm = SecureFHSSAlgorithm(sync_key=12345)
         